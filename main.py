@@ -1,49 +1,130 @@
-import UnityPy
 import os
 import json
+import io
 import traceback
-import re
 import sys
-import struct
 import zlib
-import lz4.frame
-from collections import defaultdict
+import numpy as np
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain, islice, repeat
 from pathlib import Path
-from tqdm import tqdm
+from typing import Tuple
 from datetime import datetime
 
+try:
+    import orjson
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    orjson = None
+
+try:
+    import imagecodecs
+except ImportError:
+    imagecodecs = None
+
+def get_cli_int(flag: str, default: int) -> int:
+    try:
+        return int(sys.argv[sys.argv.index(flag) + 1])
+    except (ValueError, IndexError):
+        return default
+
 DEBUG_MODE = "--debug" in sys.argv
+NDJSON_MODE = "--ndjson" in sys.argv
+MAX_LOGGED_ERRORS = 1000
+PNG_COMPRESS_LEVEL = min(max(get_cli_int("--png-level", 1), 0), 9)
 
-COMPONENT_TYPES = {
+COMPONENT_TYPES = frozenset({
     "Transform", "Animator", "SkinnedMeshRenderer", "MeshRenderer", "MeshFilter",
     "Camera", "Light", "AudioSource", "AudioListener", "CapsuleCollider",
     "PlayableDirector", "LookAtConstraint", "NavMeshAgent"
+})
+
+BUNDLE_EXTENSIONS = frozenset({"bundle", "unity3d", "assets"})
+
+UNCHECKED_READ_TYPES = frozenset({"Texture2D", "Sprite", "TextAsset", "AudioClip", "Font"})
+
+_SIGNATURES = {
+    b'UnityFS\x00': "unityfs",
+    b'UnityRaw': "raw",
+    b'LZ4\x00': "lz4",
+    b'\x78\x9c': "zlib",
+    b'\x78\x01': "zlib",
+    b'\x78\xda': "zlib",
+    b'\x1f\x8b': "gzip",
 }
 
+_ARRAY_PNG_MODES = frozenset({"L", "LA", "RGB", "RGBA"})
+
+_MISSING = object()
+_COLOR_ATTRS = ("r", "g", "b", "a")
+_JSON_OPENERS = ("{", "[")
+_JSON_CLOSERS = ("}", "]")
+_CSHARP_PREFIXES = ("using ", "namespace ", "public class", "class ")
+
+_SCALAR_TYPES = (str, int, float, bool)
+_PASSTHROUGH_TYPES = (dict, list) + _SCALAR_TYPES
+_MAX_SERIALIZE_DEPTH = 512
+
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?* '})
+
 def debug_print(message):
     if DEBUG_MODE:
         print(f"[DEBUG] {message}")
 
 def sanitize_filename(name: str) -> str:
-    sane_name = re.sub(r'[<>:"/\\|?*]', '_', name)
-    sane_name = sane_name.replace(' ', '_')
-    sane_name = sane_name.strip('_').strip()
-    if not sane_name:
-        return "Untitled"
-    return sane_name
+    sane_name = name.translate(_SANITIZE_TABLE).strip('_').strip()
+    return sane_name or "Untitled"
+
+_STAGED = None
+
+def _staged(path: str) -> str:
+    # While _extract_one runs, outputs go to a per-object temporary name; the
+    # parent renames them once it has given the object a unique final name.
+    if _STAGED is None:
+        return path
+    _STAGED[1].append(path)
+    return path + _STAGED[0]
+
+def write_json(path: str, data) -> None:
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+        except TypeError:
+            debug_print(f"orjson could not encode {path}, using stdlib json")
+        else:
+            write_bytes(path, payload)
+            return
+
+    payload = json.dumps(data, indent=2)
+    with open(_staged(path), "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.write(payload)
+
+def json_line(data) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode("utf-8")
+
+def write_bytes(path: str, data: bytes) -> None:
+    fd = os.open(_staged(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def save_png(image, path: str) -> None:
+    if imagecodecs is not None and image.mode in _ARRAY_PNG_MODES:
+        write_bytes(path, imagecodecs.png_encode(np.asarray(image), level=PNG_COMPRESS_LEVEL))
+        return
+    image.save(_staged(path), format="PNG", optimize=False, compress_level=PNG_COMPRESS_LEVEL)
 
 def detect_compression_type(data: bytes) -> str:
-    if data[:4] == b'LZ4\x00':
-        return "lz4"
-    elif data[:2] == b'\x78\x9c' or data[:2] == b'\x78\x01' or data[:2] == b'\x78\xda':
-        return "zlib"
-    elif data[:2] == b'\x1f\x8b':
-        return "gzip"
-    elif data[:8] == b'UnityFS\x00':
-        return "unityfs"
-    elif data[:7] == b'UnityRaw':
-        return "raw"
-    return "unknown"
+    return _SIGNATURES.get(data[:8]) or _SIGNATURES.get(data[:4]) or _SIGNATURES.get(data[:2]) or "unknown"
 
 def decompress_data(data: bytes, compression_type: str = None) -> bytes:
     if not compression_type:
@@ -51,6 +132,7 @@ def decompress_data(data: bytes, compression_type: str = None) -> bytes:
     
     try:
         if compression_type == "lz4":
+            import lz4.frame
             return lz4.frame.decompress(data)
         elif compression_type == "zlib":
             return zlib.decompress(data)
@@ -95,24 +177,28 @@ def extract_type_tree_info(obj) -> dict:
     
     return type_info
 
-def get_object_dependencies(obj) -> list:
+def get_object_dependencies(obj, data=None) -> list:
     dependencies = []
     try:
-        data = obj.read()
-        if hasattr(data, '__dict__'):
-            for attr_name, attr_value in data.__dict__.items():
-                if hasattr(attr_value, 'path_id') and attr_value.path_id != 0:
+        if data is None:
+            data = obj.read()
+        attributes = getattr(data, '__dict__', None)
+        if attributes is not None:
+            for attr_name, attr_value in attributes.items():
+                path_id = getattr(attr_value, 'path_id', 0)
+                if path_id != 0:
                     dependencies.append({
                         'attribute': attr_name,
-                        'path_id': attr_value.path_id,
+                        'path_id': path_id,
                         'file_id': getattr(attr_value, 'file_id', 0)
                     })
                 elif isinstance(attr_value, list):
                     for i, item in enumerate(attr_value):
-                        if hasattr(item, 'path_id') and item.path_id != 0:
+                        item_path_id = getattr(item, 'path_id', 0)
+                        if item_path_id != 0:
                             dependencies.append({
                                 'attribute': f"{attr_name}[{i}]",
-                                'path_id': item.path_id,
+                                'path_id': item_path_id,
                                 'file_id': getattr(item, 'file_id', 0)
                             })
     except:
@@ -121,33 +207,37 @@ def get_object_dependencies(obj) -> list:
     return dependencies
 
 def get_object_name(data, obj_type: str, path_id: int) -> str:
-    name_candidates = ["name", "m_Name", "m_ClassName", "m_ObjectHideFlags"]
+    _san = sanitize_filename
+    name = getattr(data, "m_Name", None) or getattr(data, "name", None)
 
-    for attr_name in name_candidates:
-        if hasattr(data, attr_name):
-            candidate = getattr(data, attr_name)
-            if candidate:
-                if isinstance(candidate, bytes):
-                    decoded_candidate = candidate.decode('utf-8', errors='ignore').strip()
-                    if decoded_candidate:
-                        return sanitize_filename(decoded_candidate)
-                elif isinstance(candidate, str) and candidate.strip():
-                    return sanitize_filename(candidate.strip())
+    if isinstance(name, bytes):
+        name = name.decode('utf-8', errors='ignore')
+    if isinstance(name, str):
+        name = name.strip()
+        if name:
+            return _san(name)
     
-    if obj_type == "MonoScript" and hasattr(data, "m_ClassName") and data.m_ClassName:
-        return sanitize_filename(data.m_ClassName)
+    if obj_type == "MonoScript":
+        class_name = getattr(data, "m_ClassName", None)
+        if class_name:
+            return _san(class_name)
     
-    if hasattr(data, "m_PathID") and data.m_PathID != 0:
-        return f"Object_{data.m_PathID}"
+    try:
+        pid = data.m_PathID
+    except AttributeError:
+        pid = 0
+    if pid != 0:
+        return f"Object_{pid}"
 
     return f"{obj_type}_{path_id}"
 
-def extract_streaming_info(obj) -> dict:
+def extract_streaming_info(obj, data=None) -> dict:
     streaming_info = {}
     try:
-        data = obj.read()
-        if hasattr(data, 'm_StreamData'):
-            stream_data = data.m_StreamData
+        if data is None:
+            data = obj.read()
+        stream_data = getattr(data, 'm_StreamData', _MISSING)
+        if stream_data is not _MISSING:
             streaming_info = {
                 'offset': getattr(stream_data, 'offset', 0),
                 'size': getattr(stream_data, 'size', 0),
@@ -160,37 +250,46 @@ def extract_streaming_info(obj) -> dict:
 
 def process_mesh_advanced(data, output_path: str) -> bool:
     try:
+        vertex_list = getattr(data, 'm_Vertices', _MISSING)
+        triangle_list = getattr(data, 'm_Triangles', _MISSING)
+        submeshes = getattr(data, 'm_SubMeshes', _MISSING)
+        shapes = getattr(getattr(data, 'm_Shapes', None), 'shapes', _MISSING)
+        bone_hashes = getattr(data, 'm_BoneNameHashes', _MISSING)
         mesh_data = {
             'name': getattr(data, 'm_Name', 'Unknown'),
-            'vertex_count': len(data.m_Vertices) if hasattr(data, 'm_Vertices') else 0,
-            'triangle_count': len(data.m_Triangles) // 3 if hasattr(data, 'm_Triangles') else 0,
-            'submesh_count': len(data.m_SubMeshes) if hasattr(data, 'm_SubMeshes') else 0,
-            'blend_shapes': len(data.m_Shapes.shapes) if hasattr(data, 'm_Shapes') and hasattr(data.m_Shapes, 'shapes') else 0,
-            'bone_count': len(data.m_BoneNameHashes) if hasattr(data, 'm_BoneNameHashes') else 0
+            'vertex_count': len(vertex_list) if vertex_list is not _MISSING else 0,
+            'triangle_count': len(triangle_list) // 3 if triangle_list is not _MISSING else 0,
+            'submesh_count': len(submeshes) if submeshes is not _MISSING else 0,
+            'blend_shapes': len(shapes) if shapes is not _MISSING else 0,
+            'bone_count': len(bone_hashes) if bone_hashes is not _MISSING else 0
         }
         
-        vertices = []
-        if hasattr(data, 'm_Vertices'):
-            for i, vertex in enumerate(data.m_Vertices):
-                if hasattr(vertex, 'x'):
-                    vertices.append([vertex.x, vertex.y, vertex.z])
-                else:
-                    vertices.append(vertex)
+        vertices = None
+        if vertex_list is not _MISSING and len(vertex_list):
+            if hasattr(vertex_list[0], 'x'):
+                vertices = np.fromiter(
+                    chain.from_iterable((vertex.x, vertex.y, vertex.z) for vertex in vertex_list),
+                    dtype=np.float64, count=3 * len(vertex_list)
+                ).reshape(-1, 3)
+            else:
+                vertices = np.asarray(vertex_list, dtype=np.float64)
+                vertices = vertices.reshape(-1, 3) if vertices.ndim == 1 else vertices[:, :3]
         
-        if vertices:
-            with open(output_path + ".obj", "w") as obj_file:
-                obj_file.write(f"# Mesh: {mesh_data['name']}\n")
-                obj_file.write(f"# Vertices: {len(vertices)}\n")
-                for vertex in vertices:
-                    obj_file.write(f"v {vertex[0]:.6f} {vertex[1]:.6f} {vertex[2]:.6f}\n")
-                
-                if hasattr(data, 'm_Triangles'):
-                    triangles = data.m_Triangles
-                    for i in range(0, len(triangles), 3):
-                        obj_file.write(f"f {triangles[i]+1} {triangles[i+1]+1} {triangles[i+2]+1}\n")
+        if vertices is not None:
+            obj_text = [
+                f"# Mesh: {mesh_data['name']}\n",
+                f"# Vertices: {len(vertices)}\n",
+                ("v %.6f %.6f %.6f\n" * len(vertices)) % tuple(vertices.ravel().tolist())
+            ]
+            
+            if triangle_list is not _MISSING:
+                triangles = np.asarray(triangle_list, dtype=np.int64).reshape(-1, 3) + 1
+                obj_text.append(("f %d %d %d\n" * len(triangles)) % tuple(triangles.ravel().tolist()))
+            
+            with open(_staged(output_path + ".obj"), "w") as obj_file:
+                obj_file.write("".join(obj_text))
         
-        with open(output_path + "_info.json", "w", encoding="utf-8") as info_file:
-            json.dump(mesh_data, info_file, indent=4)
+        write_json(output_path + "_info.json", mesh_data)
         
         return True
     except Exception as e:
@@ -199,49 +298,48 @@ def process_mesh_advanced(data, output_path: str) -> bool:
 
 def process_material_advanced(data, output_path: str) -> bool:
     try:
+        shader = getattr(data, 'm_Shader', None)
         material_data = {
             'name': getattr(data, 'm_Name', 'Unknown'),
             'shader': {
-                'name': data.m_Shader.name if hasattr(data, 'm_Shader') and hasattr(data.m_Shader, 'name') else 'Unknown',
-                'path_id': data.m_Shader.path_id if hasattr(data, 'm_Shader') and hasattr(data.m_Shader, 'path_id') else -1,
+                'name': getattr(shader, 'name', 'Unknown'),
+                'path_id': getattr(shader, 'path_id', -1),
             },
             'keywords': getattr(data, 'm_ShaderKeywords', []),
             'properties': {},
             'textures': {}
         }
         
-        if hasattr(data, 'm_SavedProperties'):
-            props = data.m_SavedProperties
-            
-            if hasattr(props, 'm_TexEnvs'):
-                for tex_env in props.m_TexEnvs:
-                    tex_name = tex_env.first if hasattr(tex_env, 'first') else 'Unknown'
-                    tex_data = tex_env.second if hasattr(tex_env, 'second') else None
-                    if tex_data:
-                        material_data['textures'][tex_name] = {
-                            'texture_path_id': tex_data.m_Texture.path_id if hasattr(tex_data, 'm_Texture') and hasattr(tex_data.m_Texture, 'path_id') else -1,
-                            'scale': [tex_data.m_Scale.x, tex_data.m_Scale.y] if hasattr(tex_data, 'm_Scale') else [1, 1],
-                            'offset': [tex_data.m_Offset.x, tex_data.m_Offset.y] if hasattr(tex_data, 'm_Offset') else [0, 0]
-                        }
+        props = getattr(data, 'm_SavedProperties', _MISSING)
+        if props is not _MISSING:
+            for tex_env in getattr(props, 'm_TexEnvs', ()):
+                tex_name = getattr(tex_env, 'first', 'Unknown')
+                tex_data = getattr(tex_env, 'second', None)
+                if tex_data:
+                    scale = getattr(tex_data, 'm_Scale', _MISSING)
+                    offset = getattr(tex_data, 'm_Offset', _MISSING)
+                    material_data['textures'][tex_name] = {
+                        'texture_path_id': getattr(getattr(tex_data, 'm_Texture', None), 'path_id', -1),
+                        'scale': [scale.x, scale.y] if scale is not _MISSING else [1, 1],
+                        'offset': [offset.x, offset.y] if offset is not _MISSING else [0, 0]
+                    }
             
-            if hasattr(props, 'm_Floats'):
-                for float_prop in props.m_Floats:
-                    prop_name = float_prop.first if hasattr(float_prop, 'first') else 'Unknown'
-                    prop_value = float_prop.second if hasattr(float_prop, 'second') else 0.0
-                    material_data['properties'][prop_name] = {'type': 'float', 'value': prop_value}
+            for float_prop in getattr(props, 'm_Floats', ()):
+                prop_name = getattr(float_prop, 'first', 'Unknown')
+                prop_value = getattr(float_prop, 'second', 0.0)
+                material_data['properties'][prop_name] = {'type': 'float', 'value': prop_value}
             
-            if hasattr(props, 'm_Colors'):
-                for color_prop in props.m_Colors:
-                    prop_name = color_prop.first if hasattr(color_prop, 'first') else 'Unknown'
-                    color_value = color_prop.second if hasattr(color_prop, 'second') else None
-                    if color_value:
-                        material_data['properties'][prop_name] = {
-                            'type': 'color',
-                            'value': [color_value.r, color_value.g, color_value.b, color_value.a] if all(hasattr(color_value, attr) for attr in ['r', 'g', 'b', 'a']) else [0, 0, 0, 1]
-                        }
+            for color_prop in getattr(props, 'm_Colors', ()):
+                prop_name = getattr(color_prop, 'first', 'Unknown')
+                color_value = getattr(color_prop, 'second', None)
+                if color_value:
+                    rgba = [getattr(color_value, attr, _MISSING) for attr in _COLOR_ATTRS]
+                    material_data['properties'][prop_name] = {
+                        'type': 'color',
+                        'value': rgba if _MISSING not in rgba else [0, 0, 0, 1]
+                    }
         
-        with open(output_path + ".json", "w", encoding="utf-8") as mat_file:
-            json.dump(material_data, mat_file, indent=4)
+        write_json(output_path + ".json", material_data)
         
         return True
     except Exception as e:
@@ -258,28 +356,25 @@ def process_animation_advanced(data, output_path: str) -> bool:
             'curves': []
         }
         
-        if hasattr(data, 'm_FloatCurves'):
-            for curve in data.m_FloatCurves:
-                curve_info = {
-                    'attribute': curve.attribute if hasattr(curve, 'attribute') else 'Unknown',
-                    'path': curve.path if hasattr(curve, 'path') else '',
-                    'type': 'float',
-                    'keyframes': []
-                }
-                
-                if hasattr(curve, 'curve') and hasattr(curve.curve, 'm_Curve'):
-                    for keyframe in curve.curve.m_Curve:
-                        curve_info['keyframes'].append({
-                            'time': keyframe.time if hasattr(keyframe, 'time') else 0.0,
-                            'value': keyframe.value if hasattr(keyframe, 'value') else 0.0,
-                            'in_tangent': keyframe.inTangent if hasattr(keyframe, 'inTangent') else 0.0,
-                            'out_tangent': keyframe.outTangent if hasattr(keyframe, 'outTangent') else 0.0
-                        })
-                
-                anim_data['curves'].append(curve_info)
+        for curve in getattr(data, 'm_FloatCurves', ()):
+            curve_info = {
+                'attribute': getattr(curve, 'attribute', 'Unknown'),
+                'path': getattr(curve, 'path', ''),
+                'type': 'float',
+                'keyframes': []
+            }
+            
+            for keyframe in getattr(getattr(curve, 'curve', None), 'm_Curve', ()):
+                curve_info['keyframes'].append({
+                    'time': getattr(keyframe, 'time', 0.0),
+                    'value': getattr(keyframe, 'value', 0.0),
+                    'in_tangent': getattr(keyframe, 'inTangent', 0.0),
+                    'out_tangent': getattr(keyframe, 'outTangent', 0.0)
+                })
+            
+            anim_data['curves'].append(curve_info)
         
-        with open(output_path + ".json", "w", encoding="utf-8") as anim_file:
-            json.dump(anim_data, anim_file, indent=4)
+        write_json(output_path + ".json", anim_data)
         
         return True
     except Exception as e:
@@ -287,35 +382,411 @@ def process_animation_advanced(data, output_path: str) -> bool:
         return False
 
 def serialize_object_data(data) -> dict:
-    if isinstance(data, (dict, list, str, int, float, bool)) or data is None:
+    if isinstance(data, _PASSTHROUGH_TYPES) or data is None:
         return data
+    if not hasattr(data, '__dict__'):
+        return str(data)
 
+    # Each entry carries the ids of the objects on its path from the root, so
+    # a reference back to an ancestor, or a child past _MAX_SERIALIZE_DEPTH,
+    # is recorded as 'Unserializable Object' instead of being walked.
     output = {}
-    if hasattr(data, '__dict__'):
-        for key, value in data.__dict__.items():
-            if isinstance(value, (str, int, float, bool)) or value is None:
-                output[key] = value
+    stack = [(data, output, frozenset((id(data),)))]
+    while stack:
+        node, node_output, path = stack.pop()
+        children_too_deep = len(path) >= _MAX_SERIALIZE_DEPTH
+
+        for key, value in node.__dict__.items():
+            if isinstance(value, _SCALAR_TYPES) or value is None:
+                node_output[key] = value
             elif isinstance(value, (list, tuple)):
-                output[key] = [serialize_object_data(item) for item in value]
+                items = node_output[key] = []
+                for item in value:
+                    if isinstance(item, _PASSTHROUGH_TYPES) or item is None:
+                        items.append(item)
+                    elif id(item) in path:
+                        items.append('Unserializable Object')
+                    elif hasattr(item, '__dict__'):
+                        if children_too_deep:
+                            items.append('Unserializable Object')
+                            continue
+                        child = {}
+                        items.append(child)
+                        stack.append((item, child, path | {id(item)}))
+                    else:
+                        items.append(str(item))
             elif hasattr(value, 'path_id'):
-                output[key] = {
+                node_output[key] = {
                     'type': 'PPtr',
                     'file_id': getattr(value, 'file_id', 0),
                     'path_id': value.path_id
                 }
+            elif id(value) in path or (children_too_deep and hasattr(value, '__dict__')):
+                node_output[key] = 'Unserializable Object'
             elif hasattr(value, '__dict__'):
-                output[key] = serialize_object_data(value)
+                child = node_output[key] = {}
+                stack.append((value, child, path | {id(value)}))
             else:
                 try:
-                    output[key] = str(value)
+                    node_output[key] = str(value)
                 except:
-                    output[key] = 'Unserializable Object'
-    else:
-        return str(data)
+                    node_output[key] = 'Unserializable Object'
 
     return output
 
-def extract_bundle_advanced(bundle_path: str = None, output_dir: str = None):
+def _shard_line(obj, output_path: str, **fields) -> bytes:
+    return json_line({"path_id": obj.path_id, "name": os.path.basename(output_path), **fields})
+
+def _dump_typetree(obj, data, output_path: str, shard: list) -> bool:
+    try:
+        info = data.read_typetree()
+        if NDJSON_MODE:
+            shard.append(_shard_line(obj, output_path, data=info))
+        else:
+            write_json(output_path + ".json", info)
+        return True
+    except:
+        return False
+
+def _error_record(path_id: int, obj_type: str, message: str, with_traceback: bool = False) -> dict:
+    record = {"object_id": path_id, "type": obj_type, "error": message}
+    if with_traceback and DEBUG_MODE:
+        record["traceback"] = traceback.format_exc()
+    return record
+
+def _handle_texture(obj, data, output_path: str, streaming_info: dict, shard: list) -> Tuple[bool, list]:
+    try:
+        save_png(data.image, output_path + ".png")
+        
+        tex_info = {
+            'width': data.m_Width if hasattr(data, 'm_Width') else 0,
+            'height': data.m_Height if hasattr(data, 'm_Height') else 0,
+            'format': str(data.m_TextureFormat) if hasattr(data, 'm_TextureFormat') else 'Unknown',
+            'mip_count': data.m_MipCount if hasattr(data, 'm_MipCount') else 1,
+            'is_readable': getattr(data, 'm_IsReadable', False),
+            'streaming_info': streaming_info
+        }
+        
+        write_json(output_path + "_info.json", tex_info)
+        return True, []
+    except Exception as tex_e:
+        debug_print(f"Texture2D extraction failed: {tex_e}")
+        return False, []
+
+def _handle_sprite(obj, data, output_path: str, streaming_info: dict, shard: list) -> Tuple[bool, list]:
+    try:
+        save_png(data.image, output_path + ".png")
+        
+        sprite_info = {
+            'rect_x': data.m_Rect.x if hasattr(data, 'm_Rect') else 0,
+            'rect_y': data.m_Rect.y if hasattr(data, 'm_Rect') else 0,
+            'rect_width': data.m_Rect.width if hasattr(data, 'm_Rect') else 0,
+            'rect_height': data.m_Rect.height if hasattr(data, 'm_Rect') else 0,
+            'pivot_x': data.m_Pivot.x if hasattr(data, 'm_Pivot') else 0.5,
+            'pivot_y': data.m_Pivot.y if hasattr(data, 'm_Pivot') else 0.5,
+            'pixels_per_unit': getattr(data, 'm_PixelsPerUnit', 100),
+            'texture_path_id': data.m_RD.texture.path_id if hasattr(data, 'm_RD') and hasattr(data.m_RD, 'texture') else -1
+        }
+        
+        write_json(output_path + "_info.json", sprite_info)
+        return True, []
+    except Exception as sprite_e:
+        debug_print(f"Sprite extraction failed: {sprite_e}")
+        return False, []
+
+def _handle_text(obj, data, output_path: str, streaming_info: dict, shard: list) -> Tuple[bool, list]:
+    raw = getattr(data, "m_Script", None)
+    if isinstance(raw, bytes):
+        content = raw.decode("utf-8", "ignore")
+    elif isinstance(raw, str):
+        content = raw
+    else:
+        content = ""
+    
+    stripped = content.strip()
+    is_json = stripped.startswith(_JSON_OPENERS) and stripped.endswith(_JSON_CLOSERS)
+    ext = ".json" if is_json else ".txt"
+    
+    write_bytes(output_path + ext, content.encode("utf-8", "replace"))
+    
+    text_info = {
+        'size': len(content),
+        'type': 'json' if is_json else 'text',
+        'encoding': 'utf-8'
+    }
+    
+    write_json(output_path + "_info.json", text_info)
+    return True, []
+
+def _handle_audio(obj, data, output_path: str, streaming_info: dict, shard: list) -> Tuple[bool, list]:
+    audio_info = {
+        'name': getattr(data, 'm_Name', 'Unknown'),
+        'length': getattr(data, 'm_Length', 0.0),
+        'frequency': getattr(data, 'm_Frequency', 0),
+        'channels': getattr(data, 'm_Channels', 0),
+        'bits_per_sample': getattr(data, 'm_BitsPerSample', 0),
+        'compression_format': getattr(data, 'm_CompressionFormat', 0),
+        'load_type': getattr(data, 'm_LoadType', 0),
+        'streaming_info': streaming_info
+    }
+    samples = getattr(data, "samples", None)
+    audio_data = None if samples else getattr(data, "m_AudioData", None)
+    
+    try:
+        if samples:
+            write_bytes(output_path + ".wav", samples)
+        elif audio_data:
+            ext = ".ogg" if audio_info['compression_format'] == 1 else ".wav"
+            write_bytes(output_path + ext, audio_data)
+        
+        write_json(output_path + "_info.json", audio_info)
+    except OSError as audio_e:
+        debug_print(f"AudioClip extraction failed: {audio_e}")
+        return False, []
+    
+    return True, []
+
+def _handle_mesh(obj, data, output_path: str, streaming_info: dict, shard: list) -> Tuple[bool, list]:
+    return process_mesh_advanced(data, output_path) or _dump_typetree(obj, data, output_path, shard), []
+
+def _handle_material(obj, data, output_path: str, streaming_info: dict, shard: list) -> Tuple[bool, list]:
+    return process_material_advanced(data, output_path) or _dump_typetree(obj, data, output_path, shard), []
+
+def _handle_animation(obj, data, output_path: str, streaming_info: dict, shard: list) -> Tuple[bool, list]:
+    return process_animation_advanced(data, output_path) or _dump_typetree(obj, data, output_path, shard), []
+
+def _handle_font(obj, data, output_path: str, streaming_info: dict, shard: list) -> Tuple[bool, list]:
+    if hasattr(data, "m_FontData") and data.m_FontData:
+        write_bytes(output_path + ".ttf", data.m_FontData)
+    else:
+        font_info = {
+            'name': getattr(data, 'm_Name', 'Unknown'),
+            'size': getattr(data, 'm_FontSize', 0),
+            'style': getattr(data, 'm_FontStyle', 0)
+        }
+        write_json(output_path + "_info.json", font_info)
+    return True, []
+
+def _handle_script(obj, data, output_path: str, streaming_info: dict, shard: list) -> Tuple[bool, list]:
+    try:
+        script_info = {
+            'class_name': getattr(data, 'm_ClassName', 'Unknown'),
+            'namespace': getattr(data, 'm_Namespace', ''),
+            'assembly_name': getattr(data, 'm_AssemblyName', 'Unknown'),
+            'execution_order': getattr(data, 'm_ExecutionOrder', 0)
+        }
+        
+        if hasattr(data, "m_Script") and data.m_Script:
+            script_content = data.m_Script
+            if isinstance(script_content, bytes):
+                script_content = script_content.decode("utf-8", "ignore")
+            
+            is_csharp = script_content.lstrip()[:16].startswith(_CSHARP_PREFIXES)
+            ext = ".cs" if is_csharp else ".txt"
+            
+            write_bytes(output_path + ext, script_content.encode("utf-8", "replace"))
+        
+        write_json(output_path + "_info.json", script_info)
+        return True, []
+    except Exception as script_e:
+        debug_print(f"MonoScript extraction failed: {script_e}")
+        return False, []
+
+def _handle_behaviour(obj, data, output_path: str, streaming_info: dict, shard: list) -> Tuple[bool, list]:
+    if _dump_typetree(obj, data, output_path, shard):
+        return True, []
+
+    basic_fields = {
+        'm_Name': getattr(data, 'm_Name', 'Unknown'),
+        'm_Enabled': getattr(data, 'm_Enabled', True),
+        'm_GameObject_PathID': data.m_GameObject.path_id if hasattr(data, 'm_GameObject') and hasattr(data.m_GameObject, 'path_id') else -1,
+        'm_Script_PathID': data.m_Script.path_id if hasattr(data, 'm_Script') and hasattr(data.m_Script, 'path_id') else -1
+    }
+    
+    if _writes_to_shard(obj.type.name):
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    write_json(output_path + "_basic.json", basic_fields)
+    return True, []
+
+def _read_generic_info(obj, data, errors: list):
+    obj_type = obj.type.name
+    try:
+        return data.read_typetree()
+    except AttributeError:
+        debug_print(f"read_typetree() failed for {obj_type}, using safe serialization.")
+        return serialize_object_data(data)
+    except Exception as e:
+        debug_print(f"An unexpected error occurred with read_typetree for {obj_type}: {e}")
+        errors.append(_error_record(obj.path_id, obj_type, f"read_typetree failed, using fallback serializer: {e}",
+                                    with_traceback=True))
+        return serialize_object_data(data)
+
+def _handle_generic(obj, data, output_path: str, streaming_info: dict, shard: list) -> Tuple[bool, list]:
+    obj_type = obj.type.name
+    errors = []
+    info = _read_generic_info(obj, data, errors)
+
+    if NDJSON_MODE:
+        try:
+            shard.append(_shard_line(obj, output_path, data=info))
+        except Exception as json_e:
+            debug_print(f"JSON serialization failed for {obj_type}: {json_e}")
+            shard.append(_shard_line(obj, output_path, text=str(info)))
+            errors.append(_error_record(obj.path_id, obj_type, f"JSON dump failed, saved as text: {json_e}"))
+        return True, errors
+
+    try:
+        write_json(output_path + ".json", info)
+    except Exception as json_e:
+        debug_print(f"JSON serialization failed for {obj_type}: {json_e}")
+        with open(_staged(output_path + ".txt"), "w", encoding="utf-8", errors="replace", buffering=1 << 16) as out_file:
+            out_file.write(str(info))
+        errors.append(_error_record(obj.path_id, obj_type, f"JSON dump failed, saved as .txt: {json_e}"))
+
+    return True, errors
+
+_HANDLERS = {
+    "Texture2D": _handle_texture,
+    "Sprite": _handle_sprite,
+    "TextAsset": _handle_text,
+    "AudioClip": _handle_audio,
+    "Mesh": _handle_mesh,
+    "Material": _handle_material,
+    "AnimationClip": _handle_animation,
+    "Font": _handle_font,
+    "MonoScript": _handle_script,
+    "MonoBehaviour": _handle_behaviour,
+}
+
+def _writes_to_shard(obj_type: str) -> bool:
+    # With --ndjson, types whose only output is a typetree dump go to
+    # <Type>.ndjson and get a directory only when a sidecar file is written.
+    return NDJSON_MODE and _HANDLERS.get(obj_type, _handle_generic) in (_handle_generic, _handle_behaviour)
+
+_BUNDLE_CACHE = {}
+_TYPE_DIRS = {}
+
+def _type_dir(output_dir: str, obj_type: str) -> str:
+    type_dir = _TYPE_DIRS.get((output_dir, obj_type))
+    if type_dir is None:
+        type_dir = _TYPE_DIRS[(output_dir, obj_type)] = os.path.join(output_dir, obj_type) + os.sep
+    return type_dir
+
+def _load_bundle(bundle_path: str):
+    # Entries are tagged with the loading pid: a forked worker must not reuse
+    # the parent's environment, whose file handle shares one OS-level offset.
+    cached = _BUNDLE_CACHE.get(bundle_path)
+    pid = os.getpid()
+    if cached is None or cached[0] != pid:
+        import UnityPy
+        env = UnityPy.load(bundle_path)
+        cached = (pid, env, list(env.objects))
+        _BUNDLE_CACHE[bundle_path] = cached
+    return cached[1], cached[2]
+
+def _extract_one(bundle_path: str, index: int, output_dir: str) -> dict:
+    global _STAGED
+    _, objects = _load_bundle(bundle_path)
+    obj = objects[index]
+    obj_type = obj.type.name
+    path_id = obj.path_id
+    result = {
+        "key": f"{obj_type}_{path_id}",
+        "type": obj_type,
+        "path_id": path_id,
+        "name": None,
+        "files": [],
+        "success": False,
+        "type_info": None,
+        "dependencies": None,
+        "ndjson": None,
+        "errors": []
+    }
+
+    _STAGED = (f".{path_id}.part", result["files"])
+    try:
+        if obj_type in UNCHECKED_READ_TYPES:
+            data = obj.read(check_read=False)
+        else:
+            data = obj.read()
+        result["type_info"] = extract_type_tree_info(obj)
+        
+        dependencies = get_object_dependencies(obj, data)
+        if dependencies:
+            result["dependencies"] = dependencies
+        
+        obj_name = get_object_name(data, obj_type, path_id)
+
+        if obj_type in COMPONENT_TYPES and hasattr(data, 'm_GameObject'):
+            try:
+                game_object_ptr = data.m_GameObject
+                if game_object_ptr and game_object_ptr.path_id != 0:
+                    game_object_data = game_object_ptr.read()
+                    go_name = getattr(game_object_data, 'm_Name', '')
+                    if go_name:
+                        obj_name = f"{sanitize_filename(go_name)}_{obj_name}"
+            except Exception as e:
+                debug_print(f"Could not read parent GameObject for {obj_type} {path_id}: {e}")
+        
+        result["name"] = obj_name
+        type_dir = _type_dir(output_dir, obj_type)
+        final_output_path = type_dir + obj_name
+
+        streaming_info = extract_streaming_info(obj, data)
+        if streaming_info and streaming_info.get('size', 0) > 0:
+            if _writes_to_shard(obj_type):
+                os.makedirs(type_dir, exist_ok=True)
+            write_json(final_output_path + "_streaming.json", streaming_info)
+
+        shard = []
+        handler = _HANDLERS.get(obj_type, _handle_generic)
+        result["success"], errors = handler(obj, data, final_output_path, streaming_info, shard)
+        result["errors"].extend(errors)
+        if shard:
+            result["ndjson"] = b"".join(shard)
+
+    except Exception as e:
+        result["errors"].append(_error_record(path_id, obj_type, str(e), with_traceback=True))
+        debug_print(f"Critical extraction error for {obj_type}_{path_id}: {e}")
+    finally:
+        _STAGED = None
+
+    return result
+
+def _publish_outputs(output_dir: str, result: dict, claimed: set) -> None:
+    # Objects are published in dispatch order, so the first one to use a name
+    # keeps it and later ones get a _<path_id> suffix instead of overwriting it.
+    # Names are compared case-insensitively to stay unique on Windows and macOS.
+    type_dir = _type_dir(output_dir, result["type"])
+    base = type_dir + result["name"]
+    name = result["name"]
+    while (type_dir, name.casefold()) in claimed:
+        name = f"{name}_{result['path_id']}"
+    claimed.add((type_dir, name.casefold()))
+    final_base = type_dir + name
+    token = f".{result['path_id']}.part"
+    for path in result["files"]:
+        try:
+            os.replace(path + token, final_base + path[len(base):])
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            result["errors"].append(_error_record(result["path_id"], result["type"], f"Could not publish {path}: {e}"))
+
+def _run_extraction(bundle_path: str, indices: list, output_dir: str, workers: int):
+    args = (repeat(bundle_path), indices, repeat(output_dir))
+    if workers <= 1 or len(indices) <= 1:
+        yield from map(_extract_one, *args)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_extract_one, *args, chunksize=32)
+
+def _format_error(error: dict) -> str:
+    traceback_text = f"Traceback:\n{error['traceback']}\n" if error.get('traceback') else ""
+    return (f"Object ID: {error['object_id']}\nType: {error['type']}\nError: {error['error']}\n"
+            f"{traceback_text}{'=' * 50}\n")
+
+def extract_bundle_advanced(bundle_path: str = None, output_dir: str = None, workers: int = None, progress: bool = True):
     if not bundle_path:
         bundle_path = input("Please enter the .bundle file path: ").strip()
     
@@ -333,6 +804,9 @@ def extract_bundle_advanced(bundle_path: str = None, output_dir: str = None):
     if not os.path.exists(bundle_path):
         print(f"Error: File '{bundle_path}' not found.")
         return
+    if os.path.isdir(bundle_path):
+        print(f"Error: '{bundle_path}' is a directory, not a bundle file.")
+        return
 
     os.makedirs(output_dir, exist_ok=True)
     
@@ -341,8 +815,8 @@ def extract_bundle_advanced(bundle_path: str = None, output_dir: str = None):
     
     log_file = os.path.join(output_dir, "extraction_log.txt")
     metadata_file = os.path.join(output_dir, "bundle_metadata.json")
-    type_tree_file = os.path.join(output_dir, "type_tree.json")
-    dependencies_file = os.path.join(output_dir, "dependencies.json")
+    type_tree_file = os.path.join(output_dir, "type_tree.jsonl")
+    dependencies_file = os.path.join(output_dir, "dependencies.jsonl")
 
     log = {
         "timestamp": datetime.now().isoformat(),
@@ -355,24 +829,20 @@ def extract_bundle_advanced(bundle_path: str = None, output_dir: str = None):
         "total_objects_processed": 0,
         "successful_extractions": 0,
         "failed_extractions": 0,
-        "errors": []
+        "errors": deque(maxlen=MAX_LOGGED_ERRORS),
+        "errors_dropped": 0
     }
     
     extracted_counts = defaultdict(int)
-    type_tree_data = {}
-    all_dependencies = {}
 
     try:
-        with open(bundle_path, "rb") as f:
-            env = UnityPy.load(f)
+        env, objects = _load_bundle(bundle_path)
     except Exception as e:
         print(f"Critical Error: Could not load bundle. Details: {e}")
         with open(log_file, "w", encoding="utf-8", errors="replace") as log_out:
-            log_out.write(f"Critical Error: {e}\n")
-            log_out.write(f"Traceback:\n{traceback.format_exc()}\n")
+            log_out.write(f"Critical Error: {e}\nTraceback:\n{traceback.format_exc()}\n")
         return
 
-    objects = list(env.objects)
     print(f"\nBundle loaded successfully. Objects found: {len(objects)}")
     
     if DEBUG_MODE:
@@ -395,325 +865,94 @@ def extract_bundle_advanced(bundle_path: str = None, output_dir: str = None):
         'extraction_timestamp': datetime.now().isoformat()
     }
 
-    with tqdm(total=len(objects), desc="Processing Assets") as pbar:
-        for obj in objects:
-            log["total_objects_processed"] += 1
-            extracted_successfully = False
-            obj_type = obj.type.name
+    buckets = defaultdict(list)
+    for index, obj in enumerate(objects):
+        buckets[obj.type.name].append(index)
 
-            try:
-                data = obj.read()
-                type_info = extract_type_tree_info(obj)
-                type_tree_data[f"{obj_type}_{obj.path_id}"] = type_info
-                
-                dependencies = get_object_dependencies(obj)
-                if dependencies:
-                    all_dependencies[f"{obj_type}_{obj.path_id}"] = dependencies
-                
-                obj_name = get_object_name(data, obj_type, obj.path_id)
-
-                if obj_type in COMPONENT_TYPES and hasattr(data, 'm_GameObject'):
-                    try:
-                        game_object_ptr = data.m_GameObject
-                        if game_object_ptr and game_object_ptr.path_id != 0:
-                            game_object_data = game_object_ptr.read()
-                            go_name = getattr(game_object_data, 'm_Name', '')
-                            if go_name:
-                                obj_name = f"{sanitize_filename(go_name)}_{obj_name}"
-                    except Exception as e:
-                        debug_print(f"Could not read parent GameObject for {obj_type} {obj.path_id}: {e}")
-                
-                final_output_path = os.path.join(output_dir, obj_type, obj_name)
-                os.makedirs(os.path.dirname(final_output_path), exist_ok=True)
-
-                streaming_info = extract_streaming_info(obj)
-                if streaming_info and streaming_info.get('size', 0) > 0:
-                    with open(final_output_path + "_streaming.json", "w", encoding="utf-8") as stream_file:
-                        json.dump(streaming_info, stream_file, indent=4)
-
-                if obj_type == "Texture2D":
-                    try:
-                        image = data.image
-                        image.save(final_output_path + ".png")
-                        
-                        tex_info = {
-                            'width': data.m_Width if hasattr(data, 'm_Width') else 0,
-                            'height': data.m_Height if hasattr(data, 'm_Height') else 0,
-                            'format': str(data.m_TextureFormat) if hasattr(data, 'm_TextureFormat') else 'Unknown',
-                            'mip_count': data.m_MipCount if hasattr(data, 'm_MipCount') else 1,
-                            'is_readable': getattr(data, 'm_IsReadable', False),
-                            'streaming_info': streaming_info
-                        }
-                        
-                        with open(final_output_path + "_info.json", "w", encoding="utf-8") as info_file:
-                            json.dump(tex_info, info_file, indent=4)
-                        
-                        extracted_successfully = True
-                    except Exception as tex_e:
-                        debug_print(f"Texture2D extraction failed: {tex_e}")
-                        
-                elif obj_type == "Sprite":
-                    try:
-                        image = data.image
-                        image.save(final_output_path + ".png")
-                        
-                        sprite_info = {
-                            'rect_x': data.m_Rect.x if hasattr(data, 'm_Rect') else 0,
-                            'rect_y': data.m_Rect.y if hasattr(data, 'm_Rect') else 0,
-                            'rect_width': data.m_Rect.width if hasattr(data, 'm_Rect') else 0,
-                            'rect_height': data.m_Rect.height if hasattr(data, 'm_Rect') else 0,
-                            'pivot_x': data.m_Pivot.x if hasattr(data, 'm_Pivot') else 0.5,
-                            'pivot_y': data.m_Pivot.y if hasattr(data, 'm_Pivot') else 0.5,
-                            'pixels_per_unit': getattr(data, 'm_PixelsPerUnit', 100),
-                            'texture_path_id': data.m_RD.texture.path_id if hasattr(data, 'm_RD') and hasattr(data.m_RD, 'texture') else -1
-                        }
-                        
-                        with open(final_output_path + "_info.json", "w", encoding="utf-8") as info_file:
-                            json.dump(sprite_info, info_file, indent=4)
-                        
-                        extracted_successfully = True
-                    except Exception as sprite_e:
-                        debug_print(f"Sprite extraction failed: {sprite_e}")
-
-                elif obj_type == "TextAsset":
-                    content = ""
-                    if hasattr(data, "m_Script") and data.m_Script is not None:
-                        if isinstance(data.m_Script, bytes):
-                            content = data.m_Script.decode(errors="ignore")
-                        elif isinstance(data.m_Script, str):
-                            content = data.m_Script
-                    
-                    is_json = content.strip().startswith(("{", "[")) and content.strip().endswith(("}", "]"))
-                    ext = ".json" if is_json else ".txt"
-                    
-                    with open(final_output_path + ext, "w", encoding="utf-8", errors="replace") as out_file:
-                        out_file.write(content)
-                    
-                    text_info = {
-                        'size': len(content),
-                        'type': 'json' if is_json else 'text',
-                        'encoding': 'utf-8'
-                    }
-                    
-                    with open(final_output_path + "_info.json", "w", encoding="utf-8") as info_file:
-                        json.dump(text_info, info_file, indent=4)
-                    
-                    extracted_successfully = True
-
-                elif obj_type == "AudioClip":
-                    try:
-                        audio_info = {
-                            'name': getattr(data, 'm_Name', 'Unknown'),
-                            'length': getattr(data, 'm_Length', 0.0),
-                            'frequency': getattr(data, 'm_Frequency', 0),
-                            'channels': getattr(data, 'm_Channels', 0),
-                            'bits_per_sample': getattr(data, 'm_BitsPerSample', 0),
-                            'compression_format': getattr(data, 'm_CompressionFormat', 0),
-                            'load_type': getattr(data, 'm_LoadType', 0),
-                            'streaming_info': streaming_info
-                        }
-                        
-                        if hasattr(data, "samples") and data.samples:
-                            with open(final_output_path + ".wav", "wb") as out_file:
-                                out_file.write(data.samples)
-                            extracted_successfully = True
-                        elif hasattr(data, "m_AudioData") and data.m_AudioData:
-                            ext = ".ogg" if audio_info['compression_format'] == 1 else ".wav"
-                            with open(final_output_path + ext, "wb") as out_file:
-                                out_file.write(data.m_AudioData)
-                            extracted_successfully = True
-                        
-                        with open(final_output_path + "_info.json", "w", encoding="utf-8") as info_file:
-                            json.dump(audio_info, info_file, indent=4)
-                        
-                        if not extracted_successfully:
-                            extracted_successfully = True
-                    except Exception as audio_e:
-                        debug_print(f"AudioClip extraction failed: {audio_e}")
-
-                elif obj_type == "Mesh":
-                    extracted_successfully = process_mesh_advanced(data, final_output_path)
-                    if not extracted_successfully:
-                        try:
-                            info = data.read_typetree()
-                            with open(final_output_path + ".json", "w", encoding="utf-8") as out_file:
-                                json.dump(info, out_file, indent=4)
-                            extracted_successfully = True
-                        except:
-                            pass
-
-                elif obj_type == "Material":
-                    extracted_successfully = process_material_advanced(data, final_output_path)
-                    if not extracted_successfully:
-                        try:
-                            info = data.read_typetree()
-                            with open(final_output_path + ".json", "w", encoding="utf-8") as out_file:
-                                json.dump(info, out_file, indent=4)
-                            extracted_successfully = True
-                        except:
-                            pass
-
-                elif obj_type == "AnimationClip":
-                    extracted_successfully = process_animation_advanced(data, final_output_path)
-                    if not extracted_successfully:
-                        try:
-                            info = data.read_typetree()
-                            with open(final_output_path + ".json", "w", encoding="utf-8") as out_file:
-                                json.dump(info, out_file, indent=4)
-                            extracted_successfully = True
-                        except:
-                            pass
-
-                elif obj_type == "Font":
-                    if hasattr(data, "m_FontData") and data.m_FontData:
-                        with open(final_output_path + ".ttf", "wb") as out_file:
-                            out_file.write(data.m_FontData)
-                        extracted_successfully = True
-                    else:
-                        font_info = {
-                            'name': getattr(data, 'm_Name', 'Unknown'),
-                            'size': getattr(data, 'm_FontSize', 0),
-                            'style': getattr(data, 'm_FontStyle', 0)
-                        }
-                        with open(final_output_path + "_info.json", "w", encoding="utf-8") as out_file:
-                            json.dump(font_info, out_file, indent=4)
-                        extracted_successfully = True
-
-                elif obj_type == "MonoScript":
-                    try:
-                        script_info = {
-                            'class_name': getattr(data, 'm_ClassName', 'Unknown'),
-                            'namespace': getattr(data, 'm_Namespace', ''),
-                            'assembly_name': getattr(data, 'm_AssemblyName', 'Unknown'),
-                            'execution_order': getattr(data, 'm_ExecutionOrder', 0)
-                        }
-                        
-                        if hasattr(data, "m_Script") and data.m_Script:
-                            script_content = data.m_Script
-                            if isinstance(script_content, bytes):
-                                script_content = script_content.decode(errors="ignore")
-                            
-                            is_csharp = script_content.strip().startswith(("using ", "namespace ", "public class", "class "))
-                            ext = ".cs" if is_csharp else ".txt"
-                            
-                            with open(final_output_path + ext, "w", encoding="utf-8", errors="replace") as out_file:
-                                out_file.write(script_content)
-                        
-                        with open(final_output_path + "_info.json", "w", encoding="utf-8") as info_file:
-                            json.dump(script_info, info_file, indent=4)
-                        
-                        extracted_successfully = True
-                    except Exception as script_e:
-                        debug_print(f"MonoScript extraction failed: {script_e}")
-
-                elif obj_type == "MonoBehaviour":
-                    try:
-                        info = data.read_typetree()
-                        with open(final_output_path + ".json", "w", encoding="utf-8") as out_file:
-                            json.dump(info, out_file, indent=4)
-                        extracted_successfully = True
-                    except:
-                        basic_fields = {
-                            'm_Name': getattr(data, 'm_Name', 'Unknown'),
-                            'm_Enabled': getattr(data, 'm_Enabled', True),
-                            'm_GameObject_PathID': data.m_GameObject.path_id if hasattr(data, 'm_GameObject') and hasattr(data.m_GameObject, 'path_id') else -1,
-                            'm_Script_PathID': data.m_Script.path_id if hasattr(data, 'm_Script') and hasattr(data.m_Script, 'path_id') else -1
-                        }
-                        
-                        with open(final_output_path + "_basic.json", "w", encoding="utf-8") as out_file:
-                            json.dump(basic_fields, out_file, indent=4)
-                        extracted_successfully = True
+    for obj_type in buckets:
+        if not _writes_to_shard(obj_type):
+            os.makedirs(os.path.join(output_dir, obj_type), exist_ok=True)
 
-                else:
-                    try:
-                        info = data.read_typetree()
-                    except AttributeError:
-                        debug_print(f"read_typetree() failed for {obj_type}, using safe serialization.")
-                        info = serialize_object_data(data)
-                    except Exception as e:
-                        debug_print(f"An unexpected error occurred with read_typetree for {obj_type}: {e}")
-                        info = serialize_object_data(data)
-                        log["errors"].append({
-                            "object_id": obj.path_id,
-                            "type": obj.type.name,
-                            "error": f"read_typetree failed, using fallback serializer: {e}",
-                            "traceback": traceback.format_exc() if DEBUG_MODE else ""
-                        })
-
-                    try:
-                        with open(final_output_path + ".json", "w", encoding="utf-8") as out_file:
-                            json.dump(info, out_file, indent=4)
-                        extracted_successfully = True
-                    except Exception as json_e:
-                        debug_print(f"JSON serialization failed for {obj_type}: {json_e}")
-                        with open(final_output_path + ".txt", "w", encoding="utf-8", errors="replace") as out_file:
-                            out_file.write(str(info))
-                        extracted_successfully = True
-                        log["errors"].append({
-                            "object_id": obj.path_id,
-                            "type": obj.type.name,
-                            "error": f"JSON dump failed, saved as .txt: {json_e}",
-                            "traceback": ""
-                        })
-
-                if extracted_successfully:
+    ordered_indices = [index for indices in buckets.values() for index in indices]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    from tqdm import tqdm
+
+    type_tree_out = open(type_tree_file, "wb", buffering=1 << 16)
+    dependencies_out = None
+    shards = {}
+    claimed = set()
+    try:
+        with tqdm(total=len(objects), desc="Processing Assets", miniters=max(1, len(objects) // 500),
+                  mininterval=0.25, smoothing=0.05, disable=not progress) as pbar:
+            for result in _run_extraction(bundle_path, ordered_indices, output_dir, workers):
+                log["total_objects_processed"] += 1
+                if result["files"]:
+                    _publish_outputs(output_dir, result, claimed)
+                if result["type_info"] is not None:
+                    type_tree_out.write(json_line({"key": result["key"], **result["type_info"]}))
+                if result["dependencies"]:
+                    if dependencies_out is None:
+                        dependencies_out = open(dependencies_file, "wb", buffering=1 << 16)
+                    dependencies_out.write(json_line({"key": result["key"], "dependencies": result["dependencies"]}))
+                if result["ndjson"] is not None:
+                    shard = shards.get(result["type"])
+                    if shard is None:
+                        shard_path = os.path.join(output_dir, result["type"] + ".ndjson")
+                        shard = shards[result["type"]] = open(shard_path, "wb", buffering=1 << 20)
+                    shard.write(result["ndjson"])
+                for error in result["errors"]:
+                    if len(log["errors"]) == MAX_LOGGED_ERRORS:
+                        log["errors_dropped"] += 1
+                    log["errors"].append(error)
+
+                if result["success"]:
                     log["successful_extractions"] += 1
-                    extracted_counts[obj_type] += 1
+                    extracted_counts[result["type"]] += 1
                 else:
                     log["failed_extractions"] += 1
 
-            except Exception as e:
-                log["failed_extractions"] += 1
-                log["errors"].append({
-                    "object_id": obj.path_id,
-                    "type": obj.type.name,
-                    "error": str(e),
-                    "traceback": traceback.format_exc() if DEBUG_MODE else ""
-                })
-                debug_print(f"Critical extraction error for {obj_type}_{obj.path_id}: {e}")
-
-            pbar.update(1)
+                pbar.update(1)
+    finally:
+        _BUNDLE_CACHE.pop(bundle_path, None)
+        type_tree_out.close()
+        if dependencies_out is not None:
+            dependencies_out.close()
+        for shard in shards.values():
+            shard.close()
 
-    with open(metadata_file, "w", encoding="utf-8") as meta_file:
-        json.dump(bundle_metadata, meta_file, indent=4)
+    write_json(metadata_file, bundle_metadata)
 
-    with open(type_tree_file, "w", encoding="utf-8") as tt_file:
-        json.dump(type_tree_data, tt_file, indent=4)
-
-    if all_dependencies:
-        with open(dependencies_file, "w", encoding="utf-8") as dep_file:
-            json.dump(all_dependencies, dep_file, indent=4)
+    report = io.StringIO()
+    report.write("== Enhanced Unity Bundle Extraction Log ==\n")
+    report.write(f"Timestamp: {log['timestamp']}\n")
+    report.write(f"Bundle: {log['bundle_path']}\n")
+    report.write(f"Signature: {log['bundle_info']['signature']}\n")
+    report.write(f"Compression: {log['bundle_info']['compression']}\n")
+    report.write(f"Size: {log['bundle_info']['size']} bytes\n\n")
+    
+    report.write(f"Total objects processed: {log['total_objects_processed']}\n")
+    report.write(f"Successfully extracted: {log['successful_extractions']}\n")
+    report.write(f"Failed extractions: {log['failed_extractions']}\n\n")
+    
+    report.write("== Asset Type Statistics ==\n")
+    if not extracted_counts:
+        report.write("No objects were successfully extracted.\n")
+    else:
+        report.write("".join(f"- {obj_type}: {count}\n" for obj_type, count in sorted(extracted_counts.items())))
+    
+    report.write("\n== Error Details ==\n")
+    if not log["errors"]:
+        report.write("No errors recorded.\n")
+    else:
+        if log["errors_dropped"]:
+            report.write(f"{log['errors_dropped']} earlier errors were dropped; showing the last {MAX_LOGGED_ERRORS}.\n")
+        report.write("".join(map(_format_error, log["errors"])))
 
-    with open(log_file, "w", encoding="utf-8", errors="replace") as log_out:
-        log_out.write("== Enhanced Unity Bundle Extraction Log ==\n")
-        log_out.write(f"Timestamp: {log['timestamp']}\n")
-        log_out.write(f"Bundle: {log['bundle_path']}\n")
-        log_out.write(f"Signature: {log['bundle_info']['signature']}\n")
-        log_out.write(f"Compression: {log['bundle_info']['compression']}\n")
-        log_out.write(f"Size: {log['bundle_info']['size']} bytes\n\n")
-        
-        log_out.write(f"Total objects processed: {log['total_objects_processed']}\n")
-        log_out.write(f"Successfully extracted: {log['successful_extractions']}\n")
-        log_out.write(f"Failed extractions: {log['failed_extractions']}\n\n")
-        
-        log_out.write("== Asset Type Statistics ==\n")
-        if not extracted_counts:
-            log_out.write("No objects were successfully extracted.\n")
-        else:
-            for obj_type, count in sorted(extracted_counts.items()):
-                log_out.write(f"- {obj_type}: {count}\n")
-        
-        log_out.write("\n== Error Details ==\n")
-        if not log["errors"]:
-            log_out.write("No errors recorded.\n")
-        else:
-            for error in log["errors"]:
-                log_out.write(f"Object ID: {error['object_id']}\n")
-                log_out.write(f"Type: {error['type']}\n")
-                log_out.write(f"Error: {error['error']}\n")
-                if error.get('traceback'):
-                    log_out.write(f"Traceback:\n{error['traceback']}\n")
-                log_out.write("=" * 50 + "\n")
+    with open(log_file, "w", encoding="utf-8", errors="replace", buffering=1 << 20) as log_out:
+        log_out.write(report.getvalue())
 
     print(f"\nExtraction completed successfully!")
     print(f"Output directory: {output_dir}")
@@ -721,11 +960,48 @@ def extract_bundle_advanced(bundle_path: str = None, output_dir: str = None):
     print(f"Generated files:")
     print(f"  - extraction_log.txt (detailed log)")
     print(f"  - bundle_metadata.json (bundle information)")
-    print(f"  - type_tree.json (object type information)")
-    if all_dependencies:
-        print(f"  - dependencies.json (object dependencies)")
+    print(f"  - type_tree.jsonl (object type information)")
+    if dependencies_out is not None:
+        print(f"  - dependencies.jsonl (object dependencies)")
+    for obj_type in sorted(shards):
+        print(f"  - {obj_type}.ndjson (typetree dumps, one object per line)")
     print("Thanks for using this script! Credit: @lenzarchive (alwizba). Licensed under MIT License.")
 
+def _iter_bundle_files(path: str):
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    _, dot, ext = entry.name.rpartition('.')
+                    if dot and ext.lower() in BUNDLE_EXTENSIONS:
+                        yield entry.path
+    except OSError:
+        pass
+    for subdir in subdirs:
+        yield from _iter_bundle_files(subdir)
+
+def _batch_output_dirs(bundle_files: list, input_path: str, output_base: str) -> list:
+    # Bundles sharing a stem (case-insensitively, for Windows/macOS) are named
+    # after their path relative to input_path so they never share a directory.
+    stem_counts = Counter(Path(bundle_file).stem.lower() for bundle_file in bundle_files)
+    used = set()
+    output_dirs = []
+    for bundle_file in bundle_files:
+        name = Path(bundle_file).stem
+        if stem_counts[name.lower()] > 1:
+            name = os.path.relpath(bundle_file, input_path).replace(os.sep, "_")
+        candidate, suffix = name, 1
+        while candidate.lower() in used:
+            suffix += 1
+            candidate = f"{name}_{suffix}"
+        used.add(candidate.lower())
+        output_dirs.append(os.path.join(output_base, candidate))
+    return output_dirs
+
 def process_batch_extraction():
     print("Batch Extraction Mode")
     input_path = input("Enter folder path containing bundle files: ").strip()
@@ -739,29 +1015,39 @@ def process_batch_extraction():
         print("Error: Output directory cannot be empty.")
         return
     
-    bundle_files = []
-    for root, dirs, files in os.walk(input_path):
-        for file in files:
-            if file.lower().endswith(('.bundle', '.unity3d', '.assets')):
-                bundle_files.append(os.path.join(root, file))
+    bundle_files = list(_iter_bundle_files(input_path))
     
     if not bundle_files:
         print("No bundle files found in the specified directory.")
         return
     
     print(f"Found {len(bundle_files)} bundle files")
+    output_dirs = _batch_output_dirs(bundle_files, input_path, output_base)
     
-    for i, bundle_file in enumerate(bundle_files, 1):
-        print(f"\nProcessing [{i}/{len(bundle_files)}]: {os.path.basename(bundle_file)}")
-        
-        bundle_name = Path(bundle_file).stem
-        output_dir = os.path.join(output_base, bundle_name)
-        
-        try:
-            extract_bundle_advanced(bundle_file, output_dir)
-        except Exception as e:
-            print(f"Failed to process {bundle_file}: {e}")
-            continue
+    workers = min(os.cpu_count() or 1, len(bundle_files))
+    if workers <= 1:
+        for i, (bundle_file, output_dir) in enumerate(zip(bundle_files, output_dirs), 1):
+            print(f"\nProcessing [{i}/{len(bundle_files)}]: {os.path.basename(bundle_file)}")
+            
+            try:
+                extract_bundle_advanced(bundle_file, output_dir)
+            except Exception as e:
+                print(f"Failed to process {bundle_file}: {e}")
+                continue
+    else:
+        # One bundle per process; each bundle is extracted serially inside its worker.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(extract_bundle_advanced, bundle_file, output_dir, 1, False): bundle_file
+                for bundle_file, output_dir in zip(bundle_files, output_dirs)
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                bundle_file = futures[future]
+                error = future.exception()
+                if error is not None:
+                    print(f"Failed to process {bundle_file}: {error}")
+                else:
+                    print(f"\nFinished [{i}/{len(bundle_files)}]: {os.path.basename(bundle_file)}")
     
     print(f"\nBatch extraction completed. Check '{output_base}' for results.")
 
@@ -771,6 +1057,9 @@ def show_bundle_info():
     if not os.path.exists(bundle_path):
         print(f"Error: File '{bundle_path}' not found.")
         return
+    if os.path.isdir(bundle_path):
+        print(f"Error: '{bundle_path}' is a directory, not a bundle file.")
+        return
     
     print(f"\nAnalyzing: {bundle_path}")
     print("=" * 60)
@@ -781,25 +1070,23 @@ def show_bundle_info():
     print(f"Compression: {file_info['compression']}")
     
     try:
-        with open(bundle_path, "rb") as f:
-            env = UnityPy.load(f)
+        import UnityPy
+        env = UnityPy.load(bundle_path)
         
         objects = list(env.objects)
         print(f"Unity version: {getattr(env, 'version', 'Unknown')}")
         print(f"Platform: {getattr(env, 'platform', 'Unknown')}")
         print(f"Total objects: {len(objects)}")
         
-        type_counts = defaultdict(int)
-        for obj in objects:
-            type_counts[obj.type.name] += 1
+        type_counts = Counter(obj.type.name for obj in objects)
         
         print(f"\nObject type distribution:")
-        for obj_type, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
+        for obj_type, count in type_counts.most_common():
             print(f"  {obj_type}: {count}")
         
         if hasattr(env, 'container') and env.container:
             print(f"\nContainer paths: {len(env.container)}")
-            for path, obj_data in list(env.container.items())[:10]:
+            for path, obj_data in islice(env.container.items(), 10):
                 print(f"  {path} -> {obj_data.type.name if hasattr(obj_data, 'type') else 'Unknown'}")
             if len(env.container) > 10:
                 print(f"  ... and {len(env.container) - 10} more")
@@ -822,6 +1109,8 @@ def main():
             print("  python main.py --batch         - Batch extraction mode")
             print("  python main.py --info          - Analyze bundle information")
             print("  python main.py --debug         - Enable debug output")
+            print("  python main.py --png-level N   - PNG compression level 0-9 (default: 1)")
+            print("  python main.py --ndjson        - Write typetree dumps as one .ndjson file per type")
             print("  python main.py --help          - Show this help")
             return
     